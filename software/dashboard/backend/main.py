@@ -1,170 +1,328 @@
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse
 import asyncio
+import logging
 import socket
 import struct
-import json
 import time
 import aiosqlite
 import uuid
+import orjson
 from datetime import datetime
 from typing import List, Dict, Any
+import numpy as np
 import uvicorn
 from contextlib import asynccontextmanager
 
-# Global variables for data storage and WebSocket connections
-connected_clients: List[WebSocket] = []
+import udp_batch
+
+# Numba is optional; stats reductions fall back to plain numpy without it
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+logger = logging.getLogger(__name__)
+
+# Global variables for data storage and WebSocket connections.
+# Each client gets a bounded queue drained by its own writer task, so a
+# slow client drops updates instead of stalling the broadcast.
+connected_clients: Dict[WebSocket, asyncio.Queue] = {}
 current_session_id: str = ""
 db_path = "telemetry.db"
 
+# Per-client outgoing queue depth; updates beyond this are dropped
+CLIENT_QUEUE_SIZE = 128
+# Broadcast payloads dropped because a client queue was full
+broadcast_drops = 0
+
+# Packets received within one interval are coalesced into a single
+# binary frame, so framing cost scales with the interval rather than
+# the packet rate
+BROADCAST_INTERVAL = 0.01
+_broadcast_buffer: List[bytes] = []
+
+# First byte of a coalesced raw-packet frame; JSON frames start with
+# '{' so the tag lets the frontend tell them apart
+RAW_FRAME_TAG = b'\x01'
+
+# Requested kernel receive buffer for the telemetry socket
+UDP_RECV_BUFFER = 12 * 1024 * 1024
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup: Initialize database and start UDP receiver
     await init_database()
     await start_new_session()
-    asyncio.create_task(start_udp_receiver())
+    # Warm the stats reduction so the first request doesn't pay the
+    # Numba compilation cost
+    _min_max_mean(telemetry_ring['temperature'][:1])
+    loop = asyncio.get_running_loop()
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    # Allow a future multi-worker setup to share the port
+    if hasattr(socket, 'SO_REUSEPORT'):
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    # Large kernel receive buffer absorbs telemetry bursts while the
+    # server is busy elsewhere. The kernel caps this at net.core.rmem_max;
+    # raise that sysctl to 12582912 to get the full buffer (see README).
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, UDP_RECV_BUFFER)
+    sock.bind(('0.0.0.0', 3000))
+    sock.setblocking(False)
+    effective_rcvbuf = sock.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF)
+    logger.info("UDP receive buffer: %d bytes (requested %d)",
+                effective_rcvbuf, UDP_RECV_BUFFER)
+    writer_task = asyncio.create_task(telemetry_write_loop())
+    broadcast_task = asyncio.create_task(broadcast_loop())
+    transport = None
+    if udp_batch.available():
+        # Drain datagrams in batches of one recvmmsg syscall each
+        receiver = udp_batch.BatchReceiver(sock)
+        loop.add_reader(sock.fileno(), drain_telemetry_batch, receiver)
+    else:
+        transport, _ = await loop.create_datagram_endpoint(
+            TelemetryProtocol, sock=sock
+        )
     yield
-    # Shutdown: cleanup if needed
-    pass
+    # Shutdown: stop receiving telemetry and flush pending writes
+    if transport is not None:
+        transport.close()
+    else:
+        loop.remove_reader(sock.fileno())
+        sock.close()
+    broadcast_task.cancel()
+    writer_task.cancel()
+    await flush_telemetry_writes()
+    await _close_db()
+
+# Serialize REST responses with orjson as well; /api/telemetry can
+# return a thousand float-heavy rows per dashboard refresh
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
+
+async def _connect():
+    """Open a database connection with performance PRAGMAs applied
+
+    WAL keeps readers and the telemetry writer from blocking each other
+    and cuts fsyncs on the batched commits; the remaining PRAGMAs are
+    per-connection and must be reapplied on every open.
+    """
+    # A larger statement cache keeps the telemetry INSERT and the API
+    # SELECTs compiled across the connection's lifetime
+    db = await aiosqlite.connect(db_path, cached_statements=100)
+    await db.execute('PRAGMA journal_mode=WAL')
+    await db.execute('PRAGMA synchronous=NORMAL')
+    await db.execute('PRAGMA temp_store=MEMORY')
+    await db.execute('PRAGMA cache_size=-64000')
+    await db.execute('PRAGMA mmap_size=268435456')
+    await db.execute('PRAGMA busy_timeout=5000')
+    await db.execute('PRAGMA wal_autocheckpoint=1000')
+    return db
+
+# Single long-lived connection shared by every handler; opened in
+# lifespan so SQLite's page cache and prepared statements are reused
+# instead of being rebuilt per query
+_db = None
+
+async def _get_db():
+    """Return the shared database connection, opening it on first use"""
+    global _db
+    if _db is None:
+        _db = await _connect()
+    return _db
 
-app = FastAPI(lifespan=lifespan)
+async def _close_db():
+    global _db
+    if _db is not None:
+        await _db.close()
+        _db = None
 
 async def init_database():
     """Initialize the SQLite database"""
-    async with aiosqlite.connect(db_path) as db:
-        await db.execute('''
-            CREATE TABLE IF NOT EXISTS sessions (
-                id TEXT PRIMARY KEY,
-                start_time TEXT NOT NULL,
-                end_time TEXT,
-                packet_count INTEGER DEFAULT 0
-            )
-        ''')
-        await db.commit()
+    db = await _get_db()
+    await db.execute('''
+        CREATE TABLE IF NOT EXISTS sessions (
+            id TEXT PRIMARY KEY,
+            start_time TEXT NOT NULL,
+            end_time TEXT,
+            packet_count INTEGER DEFAULT 0
+        )
+    ''')
+    await db.execute('''
+        CREATE TABLE IF NOT EXISTS telemetry (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            session_id TEXT NOT NULL,
+            sync TEXT NOT NULL,
+            timestamp TEXT NOT NULL,
+            temperature REAL NOT NULL,
+            accel_x REAL NOT NULL,
+            accel_y REAL NOT NULL,
+            accel_z REAL NOT NULL,
+            gyro_x REAL NOT NULL,
+            gyro_y REAL NOT NULL,
+            gyro_z REAL NOT NULL,
+            status INTEGER NOT NULL,
+            received_at_ns INTEGER NOT NULL
+        )
+    ''')
+    await db.execute('''
+        CREATE INDEX IF NOT EXISTS idx_telemetry_session
+        ON telemetry(session_id, id DESC)
+    ''')
+    await db.execute('''
+        CREATE INDEX IF NOT EXISTS idx_sessions_start
+        ON sessions(start_time)
+    ''')
+    await db.commit()
 
 async def start_new_session():
-    """Start a new telemetry session and create a new table"""
+    """Start a new telemetry session"""
     global current_session_id
     current_session_id = str(uuid.uuid4())
     session_start = datetime.now().isoformat()
-    
+
     # Create session record
-    async with aiosqlite.connect(db_path) as db:
-        await db.execute(
-            'INSERT INTO sessions (id, start_time) VALUES (?, ?)',
-            (current_session_id, session_start)
-        )
-        
-        # Create table for this session
-        table_name = f"session_{current_session_id.replace('-', '_')}"
-        await db.execute(f'''
-            CREATE TABLE IF NOT EXISTS {table_name} (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                sync TEXT NOT NULL,
-                timestamp TEXT NOT NULL,
-                temperature REAL NOT NULL,
-                accel_x REAL NOT NULL,
-                accel_y REAL NOT NULL,
-                accel_z REAL NOT NULL,
-                gyro_x REAL NOT NULL,
-                gyro_y REAL NOT NULL,
-                gyro_z REAL NOT NULL,
-                status INTEGER NOT NULL,
-                received_at TEXT NOT NULL
-            )
-        ''')
-        await db.commit()
-    
-    print(f"Started new session: {current_session_id}")
-    print(f"Created table: session_{current_session_id.replace('-', '_')}")
+    db = await _get_db()
+    await db.execute(
+        'INSERT INTO sessions (id, start_time) VALUES (?, ?)',
+        (current_session_id, session_start)
+    )
+    await db.commit()
 
-async def insert_telemetry_data(data: Dict[str, Any]):
-    """Insert telemetry data into the current session's table"""
-    table_name = f"session_{current_session_id.replace('-', '_')}"
-    
-    async with aiosqlite.connect(db_path) as db:
-        await db.execute(f'''
-            INSERT INTO {table_name} 
-            (sync, timestamp, temperature, accel_x, accel_y, accel_z, 
-             gyro_x, gyro_y, gyro_z, status, received_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            str(data['sync']), str(data['timestamp']), data['temperature'],
-            data['accel_x'], data['accel_y'], data['accel_z'],
-            data['gyro_x'], data['gyro_y'], data['gyro_z'],
-            data['status'], data['received_at']
-        ))
-        
-        # Update session packet count
+    logger.info("Started new session: %s", current_session_id)
+
+INSERT_SQL = '''
+    INSERT INTO telemetry
+    (session_id, sync, timestamp, temperature, accel_x, accel_y, accel_z,
+     gyro_x, gyro_y, gyro_z, status, received_at_ns)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+# Rows waiting to be written; the writer task blocks on this queue
+_write_queue: asyncio.Queue = asyncio.Queue()
+# Maximum rows drained into one transaction
+WRITE_BATCH_SIZE = 256
+
+def queue_telemetry_insert(vals: tuple, received_at_ns: int):
+    """Queue a packet row for the database writer task"""
+    sync, timestamp, temperature, accel_x, accel_y, accel_z, \
+        gyro_x, gyro_y, gyro_z, status = vals
+    _write_queue.put_nowait((
+        current_session_id,
+        str(sync), str(timestamp), temperature,
+        accel_x, accel_y, accel_z,
+        gyro_x, gyro_y, gyro_z,
+        status, received_at_ns
+    ))
+
+async def _write_rows(batch: List[tuple]):
+    """Write a batch of packet rows in a single transaction"""
+    db = await _get_db()
+    await db.executemany(INSERT_SQL, batch)
+
+    # One packet-count update per session per batch, not per packet
+    counts: Dict[str, int] = {}
+    for row in batch:
+        counts[row[0]] = counts.get(row[0], 0) + 1
+    for session_id, count in counts.items():
         await db.execute(
-            'UPDATE sessions SET packet_count = packet_count + 1 WHERE id = ?',
-            (current_session_id,)
+            'UPDATE sessions SET packet_count = packet_count + ? WHERE id = ?',
+            (count, session_id)
         )
-        
-        await db.commit()
+
+    await db.commit()
+
+async def flush_telemetry_writes():
+    """Drain and write everything currently queued (used at shutdown)"""
+    batch = []
+    while not _write_queue.empty():
+        batch.append(_write_queue.get_nowait())
+    if batch:
+        await _write_rows(batch)
+
+async def telemetry_write_loop():
+    """Write queued packets in batches as they arrive
+
+    Blocks until at least one row is queued, then drains whatever has
+    accumulated (up to WRITE_BATCH_SIZE) into one transaction. Under
+    load, rows pile up while the previous commit is in flight, so batch
+    size adapts to the ingest rate with no fixed flush latency.
+    """
+    while True:
+        batch = [await _write_queue.get()]
+        while len(batch) < WRITE_BATCH_SIZE and not _write_queue.empty():
+            batch.append(_write_queue.get_nowait())
+        try:
+            await _write_rows(batch)
+        except Exception as e:
+            logger.error("Telemetry flush failed: %s", e)
 
 async def get_telemetry_data(limit: int = 1000):
     """Get telemetry data from the current session"""
-    table_name = f"session_{current_session_id.replace('-', '_')}"
-    
-    async with aiosqlite.connect(db_path) as db:
-        async with db.execute(f'''
-            SELECT sync, timestamp, temperature, accel_x, accel_y, accel_z,
-                   gyro_x, gyro_y, gyro_z, status, received_at
-            FROM {table_name}
-            ORDER BY id DESC
-            LIMIT ?
-        ''', (limit,)) as cursor:
-            rows = await cursor.fetchall()
+    db = await _get_db()
+    async with db.execute('''
+        SELECT sync, timestamp, temperature, accel_x, accel_y, accel_z,
+               gyro_x, gyro_y, gyro_z, status, received_at_ns
+        FROM telemetry
+        WHERE session_id = ?
+        ORDER BY id DESC
+        LIMIT ?
+    ''', (current_session_id, limit)) as cursor:
+        rows = await cursor.fetchall()
             
-            return [
-                {
-                    'sync': int(row[0]),
-                    'timestamp': int(row[1]),
-                    'temperature': row[2],
-                    'accel_x': row[3],
-                    'accel_y': row[4],
-                    'accel_z': row[5],
-                    'gyro_x': row[6],
-                    'gyro_y': row[7],
-                    'gyro_z': row[8],
-                    'status': row[9],
-                    'received_at': row[10]
-                }
-                for row in rows
-            ]
+        return [
+            {
+                'sync': int(row[0]),
+                'timestamp': int(row[1]),
+                'temperature': row[2],
+                'accel_x': row[3],
+                'accel_y': row[4],
+                'accel_z': row[5],
+                'gyro_x': row[6],
+                'gyro_y': row[7],
+                'gyro_z': row[8],
+                'status': row[9],
+                'received_at_ns': row[10]
+            }
+            for row in rows
+        ]
 
 async def get_latest_telemetry_data():
-    """Get the latest telemetry data from the current session"""
-    table_name = f"session_{current_session_id.replace('-', '_')}"
-    
-    async with aiosqlite.connect(db_path) as db:
-        async with db.execute(f'''
-            SELECT sync, timestamp, temperature, accel_x, accel_y, accel_z,
-                   gyro_x, gyro_y, gyro_z, status, received_at
-            FROM {table_name}
-            ORDER BY id DESC
-            LIMIT 1
-        ''') as cursor:
-            row = await cursor.fetchone()
+    """Get the latest telemetry data from the current session
+
+    The newest packet is always the tail of the in-memory ring, so the
+    common case is answered without a database round-trip; the query
+    only runs when no packet has arrived yet (e.g. right after startup).
+    """
+    if ring_count > 0:
+        return recent_packet_dicts(1)[0]
+
+    db = await _get_db()
+    async with db.execute('''
+        SELECT sync, timestamp, temperature, accel_x, accel_y, accel_z,
+               gyro_x, gyro_y, gyro_z, status, received_at_ns
+        FROM telemetry
+        WHERE session_id = ?
+        ORDER BY id DESC
+        LIMIT 1
+    ''', (current_session_id,)) as cursor:
+        row = await cursor.fetchone()
             
-            if row:
-                return {
-                    'sync': int(row[0]),
-                    'timestamp': int(row[1]),
-                    'temperature': row[2],
-                    'accel_x': row[3],
-                    'accel_y': row[4],
-                    'accel_z': row[5],
-                    'gyro_x': row[6],
-                    'gyro_y': row[7],
-                    'gyro_z': row[8],
-                    'status': row[9],
-                    'received_at': row[10]
-                }
-            return None
+        if row:
+            return {
+                'sync': int(row[0]),
+                'timestamp': int(row[1]),
+                'temperature': row[2],
+                'accel_x': row[3],
+                'accel_y': row[4],
+                'accel_z': row[5],
+                'gyro_x': row[6],
+                'gyro_y': row[7],
+                'gyro_z': row[8],
+                'status': row[9],
+                'received_at_ns': row[10]
+            }
+        return None
 
 # Enable CORS for React frontend
 app.add_middleware(
@@ -175,102 +333,225 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-class TelemetryPacket:
-    """Represents the telemetry packet structure from Rust code"""
-    def __init__(self, data: bytes):
-        # Unpack the binary data according to the Rust struct
-        # sync: u64, timestamp: u64, temperature: f32,
-        # humidity: f32, altitude: f32, latitude: f32, longitude: f32,
-        # accel_x: f32, accel_y: f32, accel_z: f32,
-        # gyro_x: f32, gyro_y: f32, gyro_z: f32, status: u8
-        unpacked = struct.unpack('<QQfffffffB', data)  # Little-endian format
-        self.sync = unpacked[0]
-        self.timestamp = unpacked[1]
-        self.temperature = unpacked[2]
-        # self.humidity = unpacked[3]
-        # self.altitude = unpacked[4]
-        # self.latitude = unpacked[5]
-        # self.longitude = unpacked[6]
-        self.accel_x = unpacked[3]
-        self.accel_y = unpacked[4]
-        self.accel_z = unpacked[5]
-        self.gyro_x = unpacked[6]
-        self.gyro_y = unpacked[7]
-        self.gyro_z = unpacked[8]
-        self.status = unpacked[9]
-    
-    def to_dict(self) -> Dict[str, Any]:
-        return {
-            'sync': self.sync,
-            'timestamp': self.timestamp,
-            'temperature': self.temperature,
-            # 'humidity': self.humidity,
-            # 'altitude': self.altitude,
-            # 'latitude': self.latitude,
-            # 'longitude': self.longitude,
-            'accel_x': self.accel_x,
-            'accel_y': self.accel_y,
-            'accel_z': self.accel_z,
-            'gyro_x': self.gyro_x,
-            'gyro_y': self.gyro_y,
-            'gyro_z': self.gyro_z,
-            'status': self.status,
-            'received_at': datetime.now().isoformat()
-        }
+# Telemetry packet layout from the Rust sender (little-endian):
+# sync: u64, timestamp: u64, temperature: f32,
+# accel_x: f32, accel_y: f32, accel_z: f32,
+# gyro_x: f32, gyro_y: f32, gyro_z: f32, status: u8
+PACKET_STRUCT = struct.Struct('<QQfffffffB')
+# Bound method saves an attribute lookup per packet on the hot path
+_unpack_packet = PACKET_STRUCT.unpack_from
+PACKET_SIZE = PACKET_STRUCT.size
+# Receive timestamp appended to each raw packet forwarded to clients
+_pack_ns = struct.Struct('<Q').pack
+PACKET_FIELDS = (
+    'sync', 'timestamp', 'temperature',
+    'accel_x', 'accel_y', 'accel_z',
+    'gyro_x', 'gyro_y', 'gyro_z', 'status'
+)
 
-async def start_udp_receiver():
-    """Start UDP receiver to listen for telemetry packets"""
-    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-    sock.bind(('0.0.0.0', 3000))
-    sock.setblocking(False)
-    
-    loop = asyncio.get_event_loop()
-    
+# Ring buffer of recent packets, kept as a structure-of-arrays so stats
+# reductions run vectorized over contiguous columns
+RING_SIZE = 1000
+telemetry_ring = np.zeros(RING_SIZE, dtype=[
+    ('sync', '<u8'), ('timestamp', '<u8'), ('temperature', '<f4'),
+    ('accel_x', '<f4'), ('accel_y', '<f4'), ('accel_z', '<f4'),
+    ('gyro_x', '<f4'), ('gyro_y', '<f4'), ('gyro_z', '<f4'),
+    ('status', 'u1'), ('received_at_ns', '<i8'),
+])
+ring_head = 0
+ring_count = 0
+
+# Packets sent to newly connected WebSocket clients
+INITIAL_PUSH_SIZE = 50
+
+# Bumped on every received packet; lets cached derived data (stats)
+# detect that nothing has changed since it was computed
+packet_seq = 0
+
+# Ring columns with min/max/avg tracking
+STATS_FIELDS = (
+    'temperature',
+    'accel_x', 'accel_y', 'accel_z',
+    'gyro_x', 'gyro_y', 'gyro_z'
+)
+# Position of each stats field in the unpacked packet tuple
+STATS_INDICES = tuple(PACKET_FIELDS.index(field) for field in STATS_FIELDS)
+
+class RunningStats:
+    """Running sum/min/max over the current ring window for one column"""
+    __slots__ = ('total', 'min', 'max')
+
+    def __init__(self):
+        self.total = 0.0
+        self.min = float('inf')
+        self.max = float('-inf')
+
+    def add(self, value: float):
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+field_stats = {field: RunningStats() for field in STATS_FIELDS}
+
+def record_packet(vals: tuple, received_at_ns: int):
+    """Write an unpacked packet into the next ring buffer slot"""
+    global ring_head, ring_count, packet_seq
+
+    # When the ring is full the incoming packet evicts the oldest one:
+    # remove its contribution from the running stats first
+    dirty_fields = []
+    if ring_count == RING_SIZE:
+        evicted = telemetry_ring[ring_head]
+        for field in STATS_FIELDS:
+            stats = field_stats[field]
+            old = float(evicted[field])
+            stats.total -= old
+            if old == stats.min or old == stats.max:
+                dirty_fields.append(field)
+
+    telemetry_ring[ring_head] = vals + (received_at_ns,)
+    ring_head = (ring_head + 1) % RING_SIZE
+    if ring_count < RING_SIZE:
+        ring_count += 1
+
+    for field, idx in zip(STATS_FIELDS, STATS_INDICES):
+        field_stats[field].add(vals[idx])
+
+    # Rescan a column only when the evicted sample was its extremum
+    for field in dirty_fields:
+        stats = field_stats[field]
+        col_min, col_max, _ = _min_max_mean(telemetry_ring[field][:ring_count])
+        stats.min = float(col_min)
+        stats.max = float(col_max)
+
+    packet_seq += 1
+
+def recent_packet_dicts(limit: int = INITIAL_PUSH_SIZE) -> List[Dict[str, Any]]:
+    """Materialize the newest ring entries as packet dicts, oldest first"""
+    count = min(limit, ring_count)
+    packets = []
+    start = ring_head - count
+    for i in range(start, start + count):
+        row = telemetry_ring[i % RING_SIZE]
+        packet = {field: row[field].item() for field in PACKET_FIELDS}
+        packet['received_at_ns'] = int(row['received_at_ns'])
+        packets.append(packet)
+    return packets
+
+def ingest_packet(data: bytes):
+    """Run the full ingest path for one datagram
+
+    The ring window, running stats and database write buffer are always
+    updated; the broadcast record is built only when at least one
+    WebSocket client is listening, and reuses the wire bytes as-is with
+    the receive timestamp appended — no JSON encoding on this path.
+    """
+    vals = _unpack_packet(data)
+    received_at_ns = time.time_ns()
+
+    record_packet(vals, received_at_ns)
+    queue_telemetry_insert(vals, received_at_ns)
+
+    if connected_clients:
+        _broadcast_buffer.append(data[:PACKET_SIZE] + _pack_ns(received_at_ns))
+
+def _min_max_mean(col: np.ndarray):
+    return col.min(), col.max(), col.mean()
+
+if njit is not None:
+    # Compile the reduction to native code; cache=True persists the
+    # compiled function across restarts
+    _min_max_mean = njit(cache=True)(_min_max_mean)
+
+def _field_summary(field: str) -> Dict[str, float]:
+    stats = field_stats[field]
+    return {
+        'min': stats.min,
+        'max': stats.max,
+        'avg': stats.total / ring_count
+    }
+
+class TelemetryProtocol(asyncio.DatagramProtocol):
+    """Receives telemetry datagrams directly on the event loop"""
+    def datagram_received(self, data: bytes, addr):
+        try:
+            ingest_packet(data)
+        except struct.error as e:
+            logger.debug("Error parsing telemetry packet: %s", e)
+
+    def error_received(self, exc):
+        logger.error("UDP receiver error: %s", exc)
+
+    def connection_lost(self, exc):
+        if exc is not None:
+            logger.error("UDP transport closed unexpectedly: %s", exc)
+
+def drain_telemetry_batch(receiver: 'udp_batch.BatchReceiver'):
+    """Read and ingest all pending datagrams in one recvmmsg call"""
+    try:
+        datagrams = receiver.recv_batch()
+    except OSError as e:
+        logger.error("UDP receiver error: %s", e)
+        return
+
+    for data in datagrams:
+        try:
+            ingest_packet(data)
+        except struct.error as e:
+            logger.debug("Error parsing telemetry packet: %s", e)
+
+async def _client_writer(websocket: WebSocket, queue: asyncio.Queue):
+    """Drain one client's queue onto its socket at the client's own pace
+
+    Only socket-level failures are caught; CancelledError must propagate
+    so the endpoint's cleanup can stop this task on disconnect.
+    """
     while True:
+        payload = await queue.get()
         try:
-            # Wait for data with timeout
-            data, addr = await loop.run_in_executor(None, sock.recvfrom, 1024)
-            
-            # Parse telemetry packet
-            try:
-                packet = TelemetryPacket(data)
-                packet_dict = packet.to_dict()
-                
-                # Store the data in database
-                await insert_telemetry_data(packet_dict)
-                
-                # Broadcast to all connected WebSocket clients
-                await broadcast_telemetry(packet_dict)
-                
-            except struct.error as e:
-                print(f"Error parsing telemetry packet: {e}")
-                
-        except BlockingIOError:
-            # No data available, sleep briefly
-            await asyncio.sleep(0.1)
-        except Exception as e:
-            print(f"UDP receiver error: {e}")
-            await asyncio.sleep(0.1)
+            await websocket.send_bytes(payload)
+        except (WebSocketDisconnect, RuntimeError):
+            # Starlette raises RuntimeError for sends after close; the
+            # endpoint handler owns removal from connected_clients
+            break
 
-async def broadcast_telemetry(data: Dict[str, Any]):
-    """Broadcast telemetry data to all connected WebSocket clients"""
-    if connected_clients:
-        message = json.dumps({
-            "type": "telemetry",
-            "data": data
-        })
-        
-        # Send to all connected clients
-        disconnected_clients = []
-        for client in connected_clients:
-            try:
-                await client.send_text(message)
-            except:
-                disconnected_clients.append(client)
-        
-        # Remove disconnected clients
-        for client in disconnected_clients:
-            connected_clients.remove(client)
+def broadcast_telemetry(records: List[bytes]):
+    """Broadcast a batch of raw telemetry records to all WebSocket clients
+
+    Records are the original wire packets with the receive timestamp
+    appended; concatenating them under a one-byte tag skips JSON float
+    formatting entirely and the frontend decodes the fixed layout with a
+    DataView.
+    """
+    global broadcast_drops
+    payload = RAW_FRAME_TAG + b''.join(records)
+
+    # Hand the payload to each client's writer; a full queue means
+    # the client can't keep up, so drop this update for it
+    for queue in connected_clients.values():
+        try:
+            queue.put_nowait(payload)
+        except asyncio.QueueFull:
+            broadcast_drops += 1
+
+async def broadcast_loop():
+    """Coalesce buffered packets into one frame per BROADCAST_INTERVAL
+
+    Sending a frame per datagram per client makes framing cost scale
+    with the packet rate; draining the buffer on a fixed cadence caps it
+    at one frame per interval regardless of ingress.
+    """
+    global _broadcast_buffer
+    while True:
+        await asyncio.sleep(BROADCAST_INTERVAL)
+        if _broadcast_buffer and connected_clients:
+            batch, _broadcast_buffer = _broadcast_buffer, []
+            broadcast_telemetry(batch)
+        elif _broadcast_buffer:
+            # Nobody listening; don't let stale packets accumulate
+            _broadcast_buffer.clear()
 
 @app.get("/api/telemetry")
 async def get_telemetry():
@@ -278,6 +559,38 @@ async def get_telemetry():
     data = await get_telemetry_data()
     return {"data": data}
 
+# Stats computed at a given packet_seq; reused until new data arrives
+_stats_cache = {'seq': -1, 'value': None}
+
+@app.get("/api/telemetry/stats")
+async def get_telemetry_stats():
+    """Get min/max/avg statistics over the recent packet window"""
+    if ring_count == 0:
+        return {"stats": None}
+
+    # Dashboard polls this endpoint on a timer; skip recomputation when
+    # no packet has arrived since the cached result
+    if _stats_cache['seq'] == packet_seq:
+        return {"stats": _stats_cache['value']}
+
+    stats = {
+        "total_packets": ring_count,
+        "temperature": _field_summary('temperature'),
+        "accelerometer": {
+            "x": _field_summary('accel_x'),
+            "y": _field_summary('accel_y'),
+            "z": _field_summary('accel_z')
+        },
+        "gyroscope": {
+            "x": _field_summary('gyro_x'),
+            "y": _field_summary('gyro_y'),
+            "z": _field_summary('gyro_z')
+        }
+    }
+    _stats_cache['seq'] = packet_seq
+    _stats_cache['value'] = stats
+    return {"stats": stats}
+
 @app.get("/api/telemetry/latest")
 async def get_latest_telemetry():
     """Get the latest telemetry packet"""
@@ -293,63 +606,65 @@ async def start_new_session_endpoint():
 @app.get("/api/sessions")
 async def get_sessions():
     """Get all telemetry sessions"""
-    async with aiosqlite.connect(db_path) as db:
-        async with db.execute('''
-            SELECT id, start_time, end_time, packet_count 
-            FROM sessions 
-            ORDER BY start_time DESC
-        ''') as cursor:
-            rows = await cursor.fetchall()
+    db = await _get_db()
+    async with db.execute('''
+        SELECT id, start_time, end_time, packet_count 
+        FROM sessions 
+        ORDER BY start_time DESC
+    ''') as cursor:
+        rows = await cursor.fetchall()
             
-            return {
-                "sessions": [
-                    {
-                        "id": row[0],
-                        "start_time": row[1],
-                        "end_time": row[2],
-                        "packet_count": row[3]
-                    }
-                    for row in rows
-                ]
-            }
+        return {
+            "sessions": [
+                {
+                    "id": row[0],
+                    "start_time": row[1],
+                    "end_time": row[2],
+                    "packet_count": row[3]
+                }
+                for row in rows
+            ]
+        }
 
 @app.get("/api/sessions/current")
 async def get_current_session():
     """Get current session information"""
-    async with aiosqlite.connect(db_path) as db:
-        async with db.execute(
-            'SELECT id, start_time, end_time, packet_count FROM sessions WHERE id = ?',
-            (current_session_id,)
-        ) as cursor:
-            row = await cursor.fetchone()
+    db = await _get_db()
+    async with db.execute(
+        'SELECT id, start_time, end_time, packet_count FROM sessions WHERE id = ?',
+        (current_session_id,)
+    ) as cursor:
+        row = await cursor.fetchone()
             
-            if row:
-                return {
-                    "session": {
-                        "id": row[0],
-                        "start_time": row[1],
-                        "end_time": row[2],
-                        "packet_count": row[3]
-                    }
+        if row:
+            return {
+                "session": {
+                    "id": row[0],
+                    "start_time": row[1],
+                    "end_time": row[2],
+                    "packet_count": row[3]
                 }
-            return {"session": None}
+            }
+        return {"session": None}
 
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
     """WebSocket endpoint for real-time telemetry updates"""
     await websocket.accept()
-    connected_clients.append(websocket)
-    print(f"Client connected. Total clients: {len(connected_clients)}")
+    queue: asyncio.Queue = asyncio.Queue(maxsize=CLIENT_QUEUE_SIZE)
+    writer_task = asyncio.create_task(_client_writer(websocket, queue))
+    connected_clients[websocket] = queue
+    logger.info("Client connected. Total clients: %d", len(connected_clients))
     
     try:
-        # Send initial data
-        initial_data = await get_telemetry_data(limit=50)
+        # Send initial data from the in-memory window (no DB round-trip)
+        initial_data = recent_packet_dicts()
         if initial_data:
-            initial_message = json.dumps({
+            initial_message = orjson.dumps({
                 "type": "initial_data",
                 "data": initial_data
             })
-            await websocket.send_text(initial_message)
+            await websocket.send_bytes(initial_message)
         
         # Keep connection alive
         while True:
@@ -362,8 +677,9 @@ async def websocket_endpoint(websocket: WebSocket):
     except WebSocketDisconnect:
         pass
     finally:
-        connected_clients.remove(websocket)
-        print(f"Client disconnected. Total clients: {len(connected_clients)}")
+        writer_task.cancel()
+        connected_clients.pop(websocket, None)
+        logger.info("Client disconnected. Total clients: %d", len(connected_clients))
 
 # Serve React frontend
 app.mount("/static", StaticFiles(directory="../frontend/build/static"), name="static")
@@ -374,4 +690,17 @@ async def serve_frontend():
     return FileResponse("../frontend/build/index.html")
 
 if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # libuv-based event loop speeds up every await on the UDP, WebSocket
+    # and sqlite paths; ships with uvicorn[standard] on Linux but is not
+    # available everywhere, so fall back to the stdlib loop quietly
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    # Pin the C-accelerated websockets implementation (rather than
+    # whichever of websockets/wsproto uvicorn autodetects) and skip
+    # per-frame deflate: telemetry frames are small and frequent, so
+    # compression costs more CPU than the bytes it saves
+    uvicorn.run(app, host="0.0.0.0", port=8000,
+                ws="websockets", ws_per_message_deflate=False)
@@ -0,0 +1,102 @@
+"""
+Batched UDP receive helper using recvmmsg(2) via ctypes
+
+Pulls up to BATCH_SIZE datagrams from a socket with a single system call,
+amortizing syscall overhead across the batch on high-rate telemetry
+streams. Falls back gracefully (see available()) on platforms without
+recvmmsg; callers should then use a normal asyncio datagram endpoint.
+
+An io_uring backend (multishot recvmsg with registered buffers) would
+drop syscalls per wakeup further still; if liburing bindings ever enter
+the stack it can slot in behind the same available()/BatchReceiver
+interface without touching the caller.
+"""
+
+import ctypes
+import ctypes.util
+import errno
+import os
+import socket
+
+# Datagrams pulled per recvmmsg call
+BATCH_SIZE = 32
+# Per-datagram receive buffer size (telemetry packets are well under this)
+RECV_BUFFER_SIZE = 1024
+
+_MSG_DONTWAIT = 0x40
+
+class _iovec(ctypes.Structure):
+    _fields_ = [
+        ('iov_base', ctypes.c_void_p),
+        ('iov_len', ctypes.c_size_t),
+    ]
+
+class _msghdr(ctypes.Structure):
+    _fields_ = [
+        ('msg_name', ctypes.c_void_p),
+        ('msg_namelen', ctypes.c_uint),
+        ('msg_iov', ctypes.POINTER(_iovec)),
+        ('msg_iovlen', ctypes.c_size_t),
+        ('msg_control', ctypes.c_void_p),
+        ('msg_controllen', ctypes.c_size_t),
+        ('msg_flags', ctypes.c_int),
+    ]
+
+class _mmsghdr(ctypes.Structure):
+    _fields_ = [
+        ('msg_hdr', _msghdr),
+        ('msg_len', ctypes.c_uint),
+    ]
+
+try:
+    _libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+    _recvmmsg = _libc.recvmmsg
+    _recvmmsg.argtypes = [
+        ctypes.c_int, ctypes.POINTER(_mmsghdr),
+        ctypes.c_uint, ctypes.c_int, ctypes.c_void_p
+    ]
+    _recvmmsg.restype = ctypes.c_int
+except (AttributeError, OSError, TypeError):
+    _recvmmsg = None
+
+def available() -> bool:
+    """Whether recvmmsg is usable on this platform"""
+    return _recvmmsg is not None
+
+class BatchReceiver:
+    """Reads batches of datagrams from a socket with preallocated buffers
+
+    The mmsghdr/iovec arrays and receive buffers are allocated once and
+    reused for every call, so the per-packet cost is just the copy out of
+    the kernel plus one bytes slice.
+    """
+
+    def __init__(self, sock: socket.socket, batch_size: int = BATCH_SIZE):
+        self._fd = sock.fileno()
+        self._batch_size = batch_size
+        self._buffers = [
+            ctypes.create_string_buffer(RECV_BUFFER_SIZE)
+            for _ in range(batch_size)
+        ]
+        self._iovecs = (_iovec * batch_size)()
+        self._headers = (_mmsghdr * batch_size)()
+        for i in range(batch_size):
+            self._iovecs[i].iov_base = ctypes.cast(self._buffers[i], ctypes.c_void_p)
+            self._iovecs[i].iov_len = RECV_BUFFER_SIZE
+            self._headers[i].msg_hdr.msg_iov = ctypes.pointer(self._iovecs[i])
+            self._headers[i].msg_hdr.msg_iovlen = 1
+
+    def recv_batch(self) -> list:
+        """Return the pending datagrams as a list of bytes (possibly empty)"""
+        count = _recvmmsg(
+            self._fd, self._headers, self._batch_size, _MSG_DONTWAIT, None
+        )
+        if count <= 0:
+            err = ctypes.get_errno()
+            if count < 0 and err not in (errno.EAGAIN, errno.EWOULDBLOCK, errno.EINTR):
+                raise OSError(err, os.strerror(err))
+            return []
+        return [
+            self._buffers[i].raw[:self._headers[i].msg_len]
+            for i in range(count)
+        ]
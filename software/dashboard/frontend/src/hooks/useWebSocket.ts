@@ -1,6 +1,33 @@
 import { useEffect, useRef, useState } from 'react';
 import { TelemetryData, WebSocketMessage } from '../types/telemetry';
 
+// First byte of a coalesced raw-packet frame; JSON frames start with '{'
+const RAW_FRAME_TAG = 0x01;
+// Wire packet (<QQfffffffB, 45 bytes) plus appended u64 receive time
+const RAW_RECORD_SIZE = 53;
+
+// Decode a raw frame: tag byte, then fixed-size little-endian records
+const parseRawBatch = (buffer: ArrayBuffer): TelemetryData[] => {
+  const view = new DataView(buffer);
+  const packets: TelemetryData[] = [];
+  for (let offset = 1; offset + RAW_RECORD_SIZE <= buffer.byteLength; offset += RAW_RECORD_SIZE) {
+    packets.push({
+      sync: Number(view.getBigUint64(offset, true)),
+      timestamp: Number(view.getBigUint64(offset + 8, true)),
+      temperature: view.getFloat32(offset + 16, true),
+      accel_x: view.getFloat32(offset + 20, true),
+      accel_y: view.getFloat32(offset + 24, true),
+      accel_z: view.getFloat32(offset + 28, true),
+      gyro_x: view.getFloat32(offset + 32, true),
+      gyro_y: view.getFloat32(offset + 36, true),
+      gyro_z: view.getFloat32(offset + 40, true),
+      status: view.getUint8(offset + 44),
+      received_at_ns: Number(view.getBigUint64(offset + 45, true)),
+    });
+  }
+  return packets;
+};
+
 export const useWebSocket = (url: string) => {
   const [socket, setSocket] = useState<WebSocket | null>(null);
   const [isConnected, setIsConnected] = useState(false);
@@ -12,7 +39,9 @@ export const useWebSocket = (url: string) => {
     const connect = () => {
       try {
         const ws = new WebSocket(url);
-        
+        // Telemetry updates arrive as binary (UTF-8 JSON) frames
+        ws.binaryType = 'arraybuffer';
+
         ws.onopen = () => {
           console.log('WebSocket connected');
           setIsConnected(true);
@@ -21,13 +50,43 @@ export const useWebSocket = (url: string) => {
 
         ws.onmessage = (event) => {
           try {
-            const message: WebSocketMessage = JSON.parse(event.data);
+            // Telemetry arrives as raw binary records; everything else
+            // (initial_data etc.) is JSON
+            if (event.data instanceof ArrayBuffer
+                && new Uint8Array(event.data, 0, 1)[0] === RAW_FRAME_TAG) {
+              const batch = parseRawBatch(event.data);
+              if (batch.length > 0) {
+                setTelemetryData(prev => {
+                  const newData = [...prev, ...batch];
+                  // Keep only last 100 records for performance
+                  return newData.slice(-100);
+                });
+                setLatestData(batch[batch.length - 1]);
+              }
+              return;
+            }
+
+            const raw = event.data instanceof ArrayBuffer
+              ? new TextDecoder().decode(event.data)
+              : event.data;
+            const message: WebSocketMessage = JSON.parse(raw);
             
             if (message.type === 'initial_data' && Array.isArray(message.data)) {
               setTelemetryData(message.data);
               if (message.data.length > 0) {
                 setLatestData(message.data[message.data.length - 1]);
               }
+            } else if (message.type === 'telemetry_batch' && Array.isArray(message.data)) {
+              // Server coalesces packets into one frame every ~10 ms
+              const batch = message.data as TelemetryData[];
+              if (batch.length > 0) {
+                setTelemetryData(prev => {
+                  const newData = [...prev, ...batch];
+                  // Keep only last 100 records for performance
+                  return newData.slice(-100);
+                });
+                setLatestData(batch[batch.length - 1]);
+              }
             } else if (message.type === 'telemetry' && !Array.isArray(message.data)) {
               setTelemetryData(prev => {
                 const newData = [...prev, message.data as TelemetryData];
@@ -9,7 +9,7 @@ export interface TelemetryData {
   gyro_y: number;
   gyro_z: number;
   status: number;
-  received_at: string;
+  received_at_ns: number;
 }
 
 export interface TelemetryStats {
@@ -32,6 +32,6 @@ export interface TelemetryStats {
 }
 
 export interface WebSocketMessage {
-  type: 'telemetry' | 'initial_data';
+  type: 'telemetry' | 'telemetry_batch' | 'initial_data';
   data: TelemetryData | TelemetryData[];
 }